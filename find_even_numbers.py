@@ -1,8 +1,5 @@
-# Create a list of numbers from 1 to 10
-numbers = list(range(1, 11))
-
-# Find even numbers using list comprehension
-even_numbers = [num for num in numbers if num % 2 == 0]
+# Find even numbers from 1 to 10 by stepping over them directly
+even_numbers = list(range(2, 11, 2))
 
 # Print the results
 print("Even numbers from 1 to 10:")
@@ -10,5 +7,4 @@ print(even_numbers)
 
 # Alternative: print each number on a separate line
 print("\nEven numbers (one per line):")
-for num in even_numbers:
-    print(num)
\ No newline at end of file
+print("\n".join(map(str, even_numbers)))
\ No newline at end of file